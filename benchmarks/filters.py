@@ -0,0 +1,84 @@
+"""
+Compares the software message filtering of :class:`can.BusABC` with a
+linear scan over the filter list, for 1 to 1000 filters.
+
+Run from the repository root with ``python -m benchmarks.filters``.
+"""
+
+import random
+import timeit
+
+from can import Message
+from can._filters import FilterMatcher
+
+MESSAGE_COUNT = 10_000
+
+
+def matches_linear(filters, msg):
+    for _filter in filters:
+        if "extended" in _filter and _filter["extended"] != msg.is_extended_id:
+            continue
+        if (_filter["can_id"] ^ msg.arbitration_id) & _filter["can_mask"] == 0:
+            return True
+    return False
+
+
+def make_filters(count, rng):
+    filters = []
+    for _ in range(count):
+        if rng.random() < 0.8:
+            filters.append(
+                {"can_id": rng.randrange(0x800), "can_mask": 0x7FF, "extended": False}
+            )
+        else:
+            filters.append(
+                {
+                    "can_id": rng.randrange(0x20000000),
+                    "can_mask": rng.choice([0x1FFFFFFF, 0x1FFFFF00]),
+                    "extended": True,
+                }
+            )
+    return filters
+
+
+def make_messages(rng):
+    return [
+        Message(arbitration_id=rng.randrange(0x800), is_extended_id=False)
+        if rng.random() < 0.8
+        else Message(arbitration_id=rng.randrange(0x20000000), is_extended_id=True)
+        for _ in range(MESSAGE_COUNT)
+    ]
+
+
+def main() -> None:
+    rng = random.Random(0)
+    msgs = make_messages(rng)
+
+    print(
+        f"{'filters':>8} {'linear [msg/s]':>16} {'compiled [msg/s]':>18} {'speed-up':>9}"
+    )
+    for count in (1, 10, 50, 100, 500, 1000):
+        filters = make_filters(count, rng)
+        matcher = FilterMatcher(filters)
+        assert [matcher.matches(m) for m in msgs] == [
+            matches_linear(filters, m) for m in msgs
+        ]
+
+        linear = min(
+            timeit.repeat(
+                lambda: [matches_linear(filters, m) for m in msgs], number=1, repeat=3
+            )
+        )
+        compiled = min(
+            timeit.repeat(
+                lambda: [matcher.matches(m) for m in msgs], number=1, repeat=3
+            )
+        )
+        print(
+            f"{count:>8} {MESSAGE_COUNT / linear:>16,.0f} "
+            f"{MESSAGE_COUNT / compiled:>18,.0f} {linear / compiled:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
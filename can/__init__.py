@@ -42,6 +42,7 @@ __all__ = [
     "MF4Reader",
     "MF4Writer",
     "Notifier",
+    "OverflowPolicy",
     "Printer",
     "RedirectReader",
     "RestartableCyclicTaskABC",
@@ -120,7 +121,7 @@ from .io import (
 )
 from .listener import AsyncBufferedReader, BufferedReader, Listener, RedirectReader
 from .message import Message
-from .notifier import Notifier
+from .notifier import Notifier, OverflowPolicy
 from .thread_safe_bus import ThreadSafeBus
 from .util import set_logging_level
 
@@ -0,0 +1,125 @@
+"""
+Contains the software message filtering used by :meth:`can.BusABC.set_filters`
+for interfaces that cannot filter in the hardware or kernel layer.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, cast
+
+from can.message import Message
+from can.typechecking import CanFilterExtended, CanFilters
+
+#: Number of possible 11-bit identifiers, these are looked up in a bitmap
+STANDARD_ID_COUNT = 0x800
+
+# (masked can_id, can_mask, extended or None if the filter applies to both)
+_Filter = Tuple[int, int, Optional[bool]]
+
+# a sequence of (can_mask, set of masked can_ids) pairs
+_MaskTable = Tuple[Tuple[int, FrozenSet[int]], ...]
+
+
+class FilterMatcher:
+    """Matches messages against a list of filters in the format of
+    :meth:`can.BusABC.set_filters`.
+
+    The filters are compiled once when the matcher is created:
+
+    - duplicate filters and filters that are covered by a broader filter
+      are dropped,
+    - the remaining filters are grouped by their mask, so that each distinct
+      mask costs a single hash set lookup per message (in particular, all
+      exact match filters share one set),
+    - the result for every 11-bit identifier is precomputed into a bitmap.
+
+    The result of :meth:`matches` is always identical to checking every filter
+    one after the other.
+    """
+
+    __slots__ = ("_standard_bitmap", "_standard_table", "_extended_table")
+
+    def __init__(self, filters: CanFilters) -> None:
+        """
+        :param filters:
+            A non-empty sequence of filters, see :meth:`can.BusABC.set_filters`.
+        """
+        reduced = _drop_covered_filters(_normalize_filters(filters))
+
+        self._standard_table = _build_mask_table(reduced, extended=False)
+        self._extended_table = _build_mask_table(reduced, extended=True)
+        self._standard_bitmap = tuple(
+            _matches_mask_table(self._standard_table, can_id)
+            for can_id in range(STANDARD_ID_COUNT)
+        )
+
+    def matches(self, msg: Message) -> bool:
+        """Checks whether the given message matches at least one of the filters.
+
+        :param msg:
+            the message to check if matching
+        :return: whether the given message matches at least one filter
+        """
+        arbitration_id = msg.arbitration_id
+        if msg.is_extended_id:
+            return _matches_mask_table(self._extended_table, arbitration_id)
+        if 0 <= arbitration_id < STANDARD_ID_COUNT:
+            return self._standard_bitmap[arbitration_id]
+        # only possible for messages which were created without checks
+        return _matches_mask_table(self._standard_table, arbitration_id)
+
+
+def _matches_mask_table(table: _MaskTable, arbitration_id: int) -> bool:
+    for can_mask, can_ids in table:
+        if arbitration_id & can_mask in can_ids:
+            return True
+    return False
+
+
+def _normalize_filters(filters: CanFilters) -> Set[_Filter]:
+    normalized: Set[_Filter] = set()
+    for _filter in filters:
+        extended: Optional[bool] = None
+        if "extended" in _filter:
+            extended = cast(CanFilterExtended, _filter)["extended"]
+            if extended is None:
+                # compares unequal to every message's is_extended_id
+                continue
+        can_mask = _filter["can_mask"]
+        normalized.add((_filter["can_id"] & can_mask, can_mask, extended))
+    return normalized
+
+
+def _drop_covered_filters(filters: Set[_Filter]) -> List[_Filter]:
+    """Removes all filters that only match a subset of what another filter matches."""
+    # group by mask, so only masks that are a subset of each other are compared
+    by_mask: Dict[int, Set[_Filter]] = {}
+    for _filter in filters:
+        by_mask.setdefault(_filter[1], set()).add(_filter)
+
+    def is_covered(narrow: _Filter) -> bool:
+        narrow_id, narrow_mask, narrow_extended = narrow
+        for broad_mask, candidates in by_mask.items():
+            if broad_mask & ~narrow_mask:
+                continue
+            # the only filters with this mask that could cover the narrow one
+            for broad_extended in {None, narrow_extended}:
+                broad = (narrow_id & broad_mask, broad_mask, broad_extended)
+                if broad != narrow and broad in candidates:
+                    return True
+        return False
+
+    return [_filter for _filter in filters if not is_covered(_filter)]
+
+
+def _build_mask_table(filters: List[_Filter], extended: bool) -> _MaskTable:
+    can_ids_by_mask: Dict[int, Set[int]] = {}
+    for can_id, can_mask, filter_extended in filters:
+        if filter_extended is None or filter_extended == extended:
+            can_ids_by_mask.setdefault(can_mask, set()).add(can_id)
+
+    # check the broadest masks first, they are most likely to match
+    return tuple(
+        (can_mask, frozenset(can_ids))
+        for can_mask, can_ids in sorted(
+            can_ids_by_mask.items(), key=lambda item: bin(item[0]).count("1")
+        )
+    )
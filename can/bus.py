@@ -26,6 +26,7 @@ from typing_extensions import Self
 
 import can
 import can.typechecking
+from can._filters import FilterMatcher
 from can.broadcastmanager import CyclicSendTaskABC, ThreadBasedCyclicSendTask
 from can.message import Message
 
@@ -67,6 +68,7 @@ class BusABC(metaclass=ABCMeta):
 
     _is_shutdown: bool = False
     _can_protocol: CanProtocol = CanProtocol.CAN_20
+    _filter_matcher: Optional[FilterMatcher] = None
 
     @abstractmethod
     def __init__(
@@ -183,6 +185,114 @@ class BusABC(metaclass=ABCMeta):
         """
         raise NotImplementedError("Trying to read from a write only bus?")
 
+    def recv_batch(
+        self, max_messages: int = 64, timeout: Optional[float] = None
+    ) -> List[Message]:
+        """Block waiting for messages from the Bus and return them in one go.
+
+        Waits like :meth:`~can.BusABC.recv` until at least one message is
+        available, then also returns all further messages that are already
+        waiting in the receive queue(s), up to ``max_messages`` in total.
+        This avoids the per call overhead of :meth:`~can.BusABC.recv` under
+        high bus loads.
+
+        :param max_messages:
+            The maximum number of messages to return. Must be at least 1.
+        :param timeout:
+            seconds to wait for the first message or None to wait indefinitely
+
+        :return:
+            A list of :class:`~can.Message` objects in the order of reception.
+            The list is empty on timeout.
+
+        :raises ValueError:
+            If ``max_messages`` is less than 1
+        :raises ~can.exceptions.CanOperationError:
+            If an error occurred while reading
+        """
+        if max_messages < 1:
+            raise ValueError(f"max_messages must be at least 1, got {max_messages}")
+
+        start = time()
+        time_left = timeout
+
+        while True:
+            try:
+                msgs, already_filtered = self._recv_batch_internal(
+                    max_messages=max_messages, timeout=time_left
+                )
+            except NotImplementedError:
+                # legacy implementation that only provides its own recv()
+                msg = self.recv(timeout=timeout)
+                return [msg] if msg is not None else []
+
+            if msgs and not already_filtered:
+                msgs = [msg for msg in msgs if self._matches_filters(msg)]
+
+            if msgs:
+                if LOG.isEnabledFor(self.RECV_LOGGING_LEVEL):
+                    for msg in msgs:
+                        LOG.log(self.RECV_LOGGING_LEVEL, "Received: %s", msg)
+                return msgs
+
+            # if nothing matched, and timeout is None, try indefinitely
+            elif timeout is None:
+                continue
+
+            # try again only if there still is time, and with
+            # reduced timeout
+            else:
+                time_left = timeout - (time() - start)
+
+                if time_left > 0:
+                    continue
+
+                return []
+
+    def _recv_batch_internal(
+        self, max_messages: int, timeout: Optional[float]
+    ) -> Tuple[List[Message], bool]:
+        """
+        Read up to ``max_messages`` messages from the bus and tell whether they
+        were filtered. This method is called by :meth:`~can.BusABC.recv_batch`.
+
+        The default implementation waits up to ``timeout`` seconds for a first
+        message using :meth:`~can.BusABC._recv_internal` and then keeps
+        reading with a timeout of zero until no further message is pending.
+        Interfaces that already hold several received messages in a buffer
+        should override this method to hand out the whole buffer at once.
+
+        :param max_messages: the maximum number of messages to return
+        :param timeout: seconds to wait for the first message,
+                        see :meth:`~can.BusABC.recv`
+
+        :return:
+            1.  a list of messages that were read, empty on timeout
+            2.  a bool that is True if message filtering has already
+                been done and else False
+
+        :raises ~can.exceptions.CanOperationError:
+            If an error occurred while reading
+        :raises NotImplementedError:
+            if the bus provides it's own :meth:`~can.BusABC.recv`
+            implementation (legacy implementation)
+        """
+        msgs: List[Message] = []
+        msg, already_filtered = self._recv_internal(timeout=timeout)
+        reads = 1
+
+        # the filtering state may change between two calls (see _recv_internal),
+        # so the filters are applied here for each message individually
+        while msg is not None:
+            if already_filtered or self._matches_filters(msg):
+                msgs.append(msg)
+            if reads >= max_messages:
+                break
+            msg, already_filtered = self._recv_internal(timeout=0.0)
+            reads += 1
+
+        return msgs, True
+
     @abstractmethod
     def send(self, msg: Message, timeout: Optional[float] = None) -> None:
         """Transmit a message to the CAN bus.
@@ -203,6 +313,48 @@ class BusABC(metaclass=ABCMeta):
         """
         raise NotImplementedError("Trying to write to a readonly bus?")
 
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages to the CAN bus in the given order.
+
+        The default implementation calls :meth:`~can.BusABC.send` for each
+        message. Interfaces that can hand several frames to the driver at once
+        override this method to reduce the per message overhead.
+
+        :param msgs: The messages to transmit.
+
+        :param timeout:
+            If > 0, wait up to this many seconds in total for the messages to be
+            ACK'ed or for transmit queue to be ready depending on driver
+            implementation. Might not be supported by all interfaces.
+            None blocks indefinitely.
+
+        :return:
+            The number of messages that were accepted for transmission. This
+            may be less than ``len(msgs)`` if an error occurred after some
+            messages had already been accepted. In that case the error is not
+            raised, so the remaining messages can be passed to another call.
+
+        :raises ~can.exceptions.CanOperationError:
+            If an error occurred while sending the first message
+        """
+        end_time = None if timeout is None else time() + timeout
+        time_left = timeout
+
+        for sent, msg in enumerate(msgs):
+            if end_time is not None and sent:
+                time_left = max(0.0, end_time - time())
+            try:
+                self.send(msg, timeout=time_left)
+            except can.CanError:
+                if not sent:
+                    raise
+                LOG.debug("Sending stopped after %d of %d messages", sent, len(msgs))
+                return sent
+
+        return len(msgs)
+
     def send_periodic(
         self,
         msgs: Union[Message, Sequence[Message]],
@@ -399,8 +551,14 @@ class BusABC(metaclass=ABCMeta):
             If ``extended`` is set as well, it only matches messages where
             ``<received_is_extended> == extended``. Else it matches every
             messages based only on the arbitration ID and mask.
+
+        If the interface cannot apply the filters in the hardware or kernel,
+        they are checked in software. The filters are compiled once in this
+        method, so that the number of filters has little impact on the
+        receive performance.
         """
         self._filters = filters or None
+        self._filter_matcher = FilterMatcher(filters) if filters else None
         self._apply_filters(self._filters)
 
     def _apply_filters(self, filters: Optional[can.typechecking.CanFilters]) -> None:
@@ -425,28 +583,10 @@ class BusABC(metaclass=ABCMeta):
         """
 
         # if no filters are set, all messages are matched
-        if self._filters is None:
+        if self._filter_matcher is None:
             return True
 
-        for _filter in self._filters:
-            # check if this filter even applies to the message
-            if "extended" in _filter:
-                _filter = cast(can.typechecking.CanFilterExtended, _filter)
-                if _filter["extended"] != msg.is_extended_id:
-                    continue
-
-            # then check for the mask and id
-            can_id = _filter["can_id"]
-            can_mask = _filter["can_mask"]
-
-            # basically, we compute
-            # `msg.arbitration_id & can_mask == can_id & can_mask`
-            # by using the shorter, but equivalent from below:
-            if (can_id ^ msg.arbitration_id) & can_mask == 0:
-                return True
-
-        # nothing matched
-        return False
+        return self._filter_matcher.matches(msg)
 
     def flush_tx_buffer(self) -> None:
         """Discard every message that may be queued in the output buffer(s)."""
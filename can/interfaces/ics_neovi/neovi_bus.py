@@ -420,6 +420,15 @@ class NeoViBus(BusABC):
             return None, False
         return msg, False
 
+    def _recv_batch_internal(self, max_messages, timeout=0.1):
+        if not self.rx_buffer:
+            self._process_msg_queue(timeout=timeout)
+        msgs = []
+        while self.rx_buffer and len(msgs) < max_messages:
+            ics_msg = self.rx_buffer.popleft()
+            msgs.append(self._ics_msg_to_message(ics_msg))
+        return msgs, False
+
     def send(self, msg, timeout=0):
         """Transmit a message to the CAN bus.
 
@@ -0,0 +1,198 @@
+"""
+Defines :mod:`ctypes` bindings for the ``sendmmsg(2)`` and ``recvmmsg(2)``
+system calls of the C library, which transfer several CAN frames with a
+single system call.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+from typing import Optional, Sequence
+
+log = logging.getLogger(__name__)
+
+
+class iovec(ctypes.Structure):  # pylint: disable=invalid-name
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class msghdr(ctypes.Structure):  # pylint: disable=invalid-name
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(iovec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class mmsghdr(ctypes.Structure):  # pylint: disable=invalid-name
+    _fields_ = [
+        ("msg_hdr", msghdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+try:
+    _libc: Optional[ctypes.CDLL] = ctypes.CDLL(
+        ctypes.util.find_library("c"), use_errno=True
+    )
+except OSError as exc:
+    log.debug("The C library could not be loaded: %s", exc)
+    _libc = None
+
+try:
+    _sendmmsg = _libc.sendmmsg  # type: ignore[union-attr]
+    _sendmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(mmsghdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+    ]
+    _sendmmsg.restype = ctypes.c_int
+    SENDMMSG_AVAILABLE = True
+except (AttributeError, TypeError) as exc:
+    log.debug("sendmmsg() is not available: %s", exc)
+    SENDMMSG_AVAILABLE = False
+
+try:
+    _recvmmsg = _libc.recvmmsg  # type: ignore[union-attr]
+    _recvmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(mmsghdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+    _recvmmsg.restype = ctypes.c_int
+    RECVMMSG_AVAILABLE = True
+except (AttributeError, TypeError) as exc:
+    log.debug("recvmmsg() is not available: %s", exc)
+    RECVMMSG_AVAILABLE = False
+
+
+def sendmmsg(fileno: int, frames: Sequence[bytes], flags: int = 0) -> int:
+    """Send several frames on a connected or bound socket with one system call.
+
+    :param fileno:
+        The file descriptor of the socket.
+    :param frames:
+        The raw frames to send, each one is sent as a separate datagram.
+    :param flags:
+        Flags for the system call, e.g. :data:`socket.MSG_DONTWAIT`.
+
+    :return:
+        The number of frames that were sent. This may be less
+        than ``len(frames)`` if the transmit queue ran full.
+
+    :raises OSError:
+        If not even the first frame could be sent.
+    """
+    count = len(frames)
+    if not count:
+        return 0
+
+    buffer = ctypes.create_string_buffer(b"".join(frames))
+    iovecs = (iovec * count)()
+    msgvec = (mmsghdr * count)()
+
+    address = ctypes.addressof(buffer)
+    for index, frame in enumerate(frames):
+        iovecs[index].iov_base = address
+        iovecs[index].iov_len = len(frame)
+        msgvec[index].msg_hdr.msg_iov = ctypes.pointer(iovecs[index])
+        msgvec[index].msg_hdr.msg_iovlen = 1
+        address += len(frame)
+
+    result = _sendmmsg(fileno, msgvec, count, flags)
+    if result < 0:
+        error = ctypes.get_errno()
+        raise OSError(error, os.strerror(error))
+    return result
+
+
+class ReceiveBuffer:
+    """Preallocated memory to receive up to ``capacity`` datagrams with a
+    single ``recvmmsg(2)`` call.
+
+    The memory is reused by every call of :meth:`receive`, so the received
+    data has to be consumed before receiving again. Datagram ``i`` starts at
+    ``i * datagram_size`` in :attr:`datagrams`, its control message at
+    ``i * control_size`` in :attr:`controls` and its source address at
+    ``i * name_size`` in :attr:`names`. The lengths and flags are found in
+    the ``i``-th entry of :attr:`headers`.
+    """
+
+    def __init__(
+        self, capacity: int, datagram_size: int, control_size: int, name_size: int
+    ) -> None:
+        self.capacity = capacity
+        self.datagram_size = datagram_size
+        self.control_size = control_size
+        self.name_size = name_size
+
+        self._datagrams = ctypes.create_string_buffer(capacity * datagram_size)
+        self._controls = ctypes.create_string_buffer(capacity * control_size)
+        self._names = ctypes.create_string_buffer(capacity * name_size)
+        self._iovecs = (iovec * capacity)()
+        self.headers = (mmsghdr * capacity)()
+
+        #: Byte views of the received data, control messages and addresses
+        self.datagrams = memoryview(self._datagrams).cast("B")
+        self.controls = memoryview(self._controls).cast("B")
+        self.names = memoryview(self._names).cast("B")
+
+        datagrams_address = ctypes.addressof(self._datagrams)
+        controls_address = ctypes.addressof(self._controls)
+        names_address = ctypes.addressof(self._names)
+        for index in range(capacity):
+            self._iovecs[index].iov_base = datagrams_address + index * datagram_size
+            self._iovecs[index].iov_len = datagram_size
+            header = self.headers[index].msg_hdr
+            header.msg_iov = ctypes.pointer(self._iovecs[index])
+            header.msg_iovlen = 1
+            header.msg_control = controls_address + index * control_size
+            header.msg_name = names_address + index * name_size
+
+        # the kernel overwrites the buffer lengths of the filled headers
+        self._used = capacity
+
+    def receive(self, fileno: int, count: int, flags: int = 0) -> int:
+        """Receive up to ``count`` datagrams with one system call.
+
+        :param fileno:
+            The file descriptor of the socket.
+        :param count:
+            The maximum number of datagrams, at most :attr:`capacity`.
+        :param flags:
+            Flags for the system call, e.g. :data:`socket.MSG_DONTWAIT`.
+
+        :return:
+            The number of received datagrams, 0 if the call would block.
+
+        :raises OSError:
+            If the system call failed.
+        """
+        count = min(count, self.capacity)
+        for index in range(self._used):
+            header = self.headers[index].msg_hdr
+            header.msg_controllen = self.control_size
+            header.msg_namelen = self.name_size
+            header.msg_flags = 0
+
+        result = _recvmmsg(fileno, self.headers, count, flags, None)
+        if result < 0:
+            self._used = 0
+            error = ctypes.get_errno()
+            if error in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return 0
+            raise OSError(error, os.strerror(error))
+        self._used = result
+        return result
@@ -8,6 +8,7 @@ At the end of the file the usage of the internal methods is shown.
 import ctypes
 import ctypes.util
 import errno
+import functools
 import logging
 import select
 import socket
@@ -25,6 +26,12 @@ from can.broadcastmanager import (
     RestartableCyclicTaskABC,
 )
 from can.interfaces.socketcan import constants
+from can.interfaces.socketcan.mmsg import (
+    RECVMMSG_AVAILABLE,
+    SENDMMSG_AVAILABLE,
+    ReceiveBuffer,
+    sendmmsg,
+)
 from can.interfaces.socketcan.utils import find_available_interfaces, pack_filters
 from can.typechecking import CanFilters
 
@@ -514,7 +521,7 @@ def bind_socket(sock: socket.socket, channel: str = "can0") -> None:
 
 
 def capture_message(
-    sock: socket.socket, get_channel: bool = False
+    sock: socket.socket, get_channel: bool = False, flags: int = 0
 ) -> Optional[Message]:
     """
     Captures a message from given socket.
@@ -523,18 +530,25 @@ def capture_message(
         The socket to read a message from.
     :param get_channel:
         Find out which channel the message comes from.
+    :param flags:
+        Flags passed on to :meth:`socket.socket.recvmsg`, e.g.
+        :data:`socket.MSG_DONTWAIT` to not block if no frame is pending.
 
-    :return: The received message, or None on failure.
+    :return: The received message, or None on failure or if no frame
+             was pending in non-blocking mode.
     """
     # Fetching the Arb ID, DLC and Data
     try:
         cf, ancillary_data, msg_flags, addr = sock.recvmsg(
-            constants.CANFD_MTU, RECEIVED_ANCILLARY_BUFFER_SIZE
+            constants.CANFD_MTU, RECEIVED_ANCILLARY_BUFFER_SIZE, flags
         )
         if get_channel:
             channel = addr[0] if isinstance(addr, tuple) else addr
         else:
             channel = None
+    except BlockingIOError:
+        # no frame pending (only with MSG_DONTWAIT or a non-blocking socket)
+        return None
     except OSError as error:
         raise can.CanOperationError(f"Error receiving: {error.strerror}", error.errno)
 
@@ -600,6 +614,124 @@ if CMSG_SPACE_available:
     RECEIVED_TIMESTAMP_STRUCT = struct.Struct("@ll")
     RECEIVED_ANCILLARY_BUFFER_SIZE = CMSG_SPACE(RECEIVED_TIMESTAMP_STRUCT.size)
 
+    # struct cmsghdr, the data follows at offset CMSG_LEN(0)
+    CONTROL_MESSAGE_HEADER_STRUCT = struct.Struct("@Nii")
+    CONTROL_MESSAGE_DATA_OFFSET = socket.CMSG_LEN(0)
+
+# The family and interface index at the start of struct sockaddr_can
+SOCKADDR_CAN_STRUCT = struct.Struct("@Hi")
+# sizeof(struct sockaddr_can), including the largest member of its address union
+SOCKADDR_CAN_SIZE = 24
+
+#: Number of frames that are received with a single ``recvmmsg(2)`` call
+RX_BUFFER_CAPACITY = 64
+
+
+@functools.lru_cache(maxsize=64)
+def _interface_name(ifindex: int) -> str:
+    return socket.if_indextoname(ifindex)
+
+
+def capture_messages(
+    sock: socket.socket,
+    rx_buffer: ReceiveBuffer,
+    max_messages: int,
+    get_channel: bool = False,
+    flags: int = 0,
+) -> List[Message]:
+    """
+    Captures all pending messages from the given socket, up to
+    ``max_messages``, with a single ``recvmmsg(2)`` system call.
+
+    The result is identical to calling :func:`capture_message` repeatedly.
+
+    :param sock:
+        The socket to read the messages from.
+    :param rx_buffer:
+        The memory to receive into, which is reused by each call.
+        It must fit :data:`~constants.CANFD_MTU` bytes of data,
+        :data:`RECEIVED_ANCILLARY_BUFFER_SIZE` bytes of control messages
+        and :data:`SOCKADDR_CAN_SIZE` bytes of address per frame.
+    :param max_messages:
+        The maximum number of messages to receive, at most
+        :attr:`~can.interfaces.socketcan.mmsg.ReceiveBuffer.capacity`.
+    :param get_channel:
+        Find out which channel each message comes from.
+    :param flags:
+        Flags passed on to the system call, e.g.
+        :data:`socket.MSG_DONTWAIT` to not block if no frame is pending.
+
+    :return: The received messages, empty if no frame was pending in
+             non-blocking mode.
+    """
+    try:
+        count = rx_buffer.receive(sock.fileno(), max_messages, flags)
+    except OSError as error:
+        raise can.CanOperationError(f"Error receiving: {error.strerror}", error.errno)
+
+    datagrams = rx_buffer.datagrams
+    controls = rx_buffer.controls
+    names = rx_buffer.names
+    headers = rx_buffer.headers
+    unpack_frame_header = CAN_FRAME_HEADER_STRUCT.unpack_from
+    unpack_control_header = CONTROL_MESSAGE_HEADER_STRUCT.unpack_from
+    unpack_timestamp = RECEIVED_TIMESTAMP_STRUCT.unpack_from
+
+    msgs: List[Message] = []
+    for index in range(count):
+        entry = headers[index]
+        header = entry.msg_hdr
+        offset = index * rx_buffer.datagram_size
+        can_id, can_dlc, fd_flags = unpack_frame_header(datagrams, offset)
+        is_fd = entry.msg_len == constants.CANFD_MTU
+        if not is_fd:
+            # Flags not valid in non-FD frames
+            fd_flags = 0
+
+        # Fetching the timestamp, see capture_message()
+        control_offset = index * rx_buffer.control_size
+        _, cmsg_level, cmsg_type = unpack_control_header(controls, control_offset)
+        assert (
+            header.msg_controllen >= RECEIVED_ANCILLARY_BUFFER_SIZE
+            and cmsg_level == socket.SOL_SOCKET
+            and cmsg_type == constants.SO_TIMESTAMPNS
+        ), "received control message type that was not requested"
+        seconds, nanoseconds = unpack_timestamp(
+            controls, control_offset + CONTROL_MESSAGE_DATA_OFFSET
+        )
+        if nanoseconds >= 1e9:
+            raise can.CanOperationError(
+                f"Timestamp nanoseconds field was out of range: {nanoseconds} not less than 1e9"
+            )
+
+        channel = None
+        if get_channel and header.msg_namelen >= SOCKADDR_CAN_STRUCT.size:
+            _, ifindex = SOCKADDR_CAN_STRUCT.unpack_from(
+                names, index * rx_buffer.name_size
+            )
+            channel = _interface_name(ifindex)
+
+        is_extended_frame_format = bool(can_id & constants.CAN_EFF_FLAG)
+        msgs.append(
+            Message(
+                timestamp=seconds + nanoseconds * 1e-9,
+                channel=channel,
+                arbitration_id=can_id
+                & (0x1FFFFFFF if is_extended_frame_format else 0x000007FF),
+                is_extended_id=is_extended_frame_format,
+                is_remote_frame=bool(can_id & constants.CAN_RTR_FLAG),
+                is_error_frame=bool(can_id & constants.CAN_ERR_FLAG),
+                is_fd=is_fd,
+                is_rx=not header.msg_flags & socket.MSG_DONTROUTE,
+                bitrate_switch=bool(fd_flags & constants.CANFD_BRS),
+                error_state_indicator=bool(fd_flags & constants.CANFD_ESI),
+                dlc=can_dlc,
+                data=datagrams[offset + 8 : offset + 8 + can_dlc],
+            )
+        )
+
+    return msgs
+
 
 class SocketcanBus(BusABC):
     """A SocketCAN interface to CAN.
@@ -654,6 +786,7 @@ class SocketcanBus(BusABC):
         self.channel_info = f"socketcan channel '{channel}'"
         self._bcm_sockets: Dict[str, socket.socket] = {}
         self._is_filtered = False
+        self._rx_buffer: Optional[ReceiveBuffer] = None
         self._task_id = 0
         self._task_id_guard = threading.Lock()
         self._can_protocol = CanProtocol.CAN_FD if fd else CanProtocol.CAN_20
@@ -750,6 +883,71 @@ class SocketcanBus(BusABC):
         # socket wasn't readable or timeout occurred
         return None, self._is_filtered
 
+    def _recv_batch_internal(
+        self, max_messages: int, timeout: Optional[float]
+    ) -> Tuple[List[Message], bool]:
+        try:
+            ready_receive_sockets, _, _ = select.select([self.socket], [], [], timeout)
+        except OSError as error:
+            # something bad happened (e.g. the interface went down)
+            raise can.CanOperationError(
+                f"Failed to receive: {error.strerror}", error.errno
+            )
+
+        msgs: List[Message] = []
+        if not ready_receive_sockets:
+            # socket wasn't readable or timeout occurred
+            return msgs, self._is_filtered
+
+        get_channel = self.channel == ""
+        if RECVMMSG_AVAILABLE and CMSG_SPACE_available:
+            return self._capture_messages(max_messages, get_channel), self._is_filtered
+
+        # the first read cannot block since select() reported the socket
+        # as readable, all further frames are drained without blocking
+        msg = capture_message(self.socket, get_channel)
+        while msg is not None:
+            if not msg.channel and self.channel:
+                # Default to our own channel
+                msg.channel = self.channel
+            msgs.append(msg)
+            if len(msgs) >= max_messages:
+                break
+            msg = capture_message(self.socket, get_channel, socket.MSG_DONTWAIT)
+
+        return msgs, self._is_filtered
+
+    def _capture_messages(self, max_messages: int, get_channel: bool) -> List[Message]:
+        """Receives all pending frames, up to ``max_messages``, with as few
+        ``recvmmsg(2)`` calls as the receive buffer allows."""
+        if self._rx_buffer is None:
+            self._rx_buffer = ReceiveBuffer(
+                RX_BUFFER_CAPACITY,
+                constants.CANFD_MTU,
+                RECEIVED_ANCILLARY_BUFFER_SIZE,
+                SOCKADDR_CAN_SIZE,
+            )
+
+        msgs: List[Message] = []
+        while len(msgs) < max_messages:
+            requested = min(max_messages - len(msgs), RX_BUFFER_CAPACITY)
+            received = capture_messages(
+                self.socket,
+                self._rx_buffer,
+                requested,
+                get_channel,
+                socket.MSG_DONTWAIT,
+            )
+            msgs.extend(received)
+            if len(received) < requested:
+                break
+
+        for msg in msgs:
+            if not msg.channel and self.channel:
+                # Default to our own channel
+                msg.channel = self.channel
+        return msgs
+
     def send(self, msg: Message, timeout: Optional[float] = None) -> None:
         """Transmit a message to the CAN bus.
 
@@ -788,6 +986,63 @@ class SocketcanBus(BusABC):
 
         raise can.CanOperationError("Transmit buffer full")
 
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages to the CAN bus.
+
+        If the bus is bound to a single channel, the frames are passed to the
+        kernel with as few ``sendmmsg(2)`` system calls as possible.
+
+        :param msgs: The messages to transmit.
+        :param timeout:
+            Wait up to this many seconds for the transmit queue to be ready.
+            If not given, the call may fail immediately.
+
+        :return: The number of messages that were written.
+
+        :raises ~can.exceptions.CanError:
+            if not even the first message could be written.
+        """
+        if not SENDMMSG_AVAILABLE or self.channel == "":
+            # each message must be addressed to its channel individually
+            return super().send_batch(msgs, timeout)
+
+        log_tx.debug("sending %d messages", len(msgs))
+
+        started = time.time()
+        # If no timeout is given, poll for availability
+        if timeout is None:
+            timeout = 0
+        time_left = timeout
+        frames = [build_can_frame(msg) for msg in msgs]
+        sent = 0
+
+        while time_left >= 0 and sent < len(frames):
+            # Wait for write availability
+            ready = select.select([], [self.socket], [], time_left)[1]
+            if not ready:
+                # Timeout
+                break
+            try:
+                sent += sendmmsg(
+                    self.socket.fileno(), frames[sent:], socket.MSG_DONTWAIT
+                )
+            except BlockingIOError:
+                pass
+            except OSError as error:
+                if not sent:
+                    raise can.CanOperationError(
+                        f"Failed to transmit: {error.strerror}", error.errno
+                    )
+                log_tx.debug("Failed to transmit: %s", error.strerror)
+                return sent
+            time_left = timeout - (time.time() - started)
+
+        if frames and not sent:
+            raise can.CanOperationError("Transmit buffer full")
+        return sent
+
     def _send_once(self, data: bytes, channel: Optional[str] = None) -> int:
         try:
             if self.channel == "" and channel:
@@ -170,6 +170,17 @@ class SocketCanDaemonBus(can.BusABC):
             log.error(f"Failed to receive: {exc}  {traceback.format_exc()}")
             raise can.CanError(f"Failed to receive: {exc}  {traceback.format_exc()}")
 
+    def _recv_batch_internal(self, max_messages, timeout):
+        can_message, _ = self._recv_internal(timeout)
+        if can_message is None:
+            return [], False
+
+        # hand out everything that was parsed from the last TCP read
+        can_messages = [can_message]
+        while self.__message_buffer and len(can_messages) < max_messages:
+            can_messages.append(self.__message_buffer.popleft())
+        return can_messages, False
+
     def _tcp_send(self, msg: str):
         log.debug(f"Sending TCP Message: '{msg}'")
         self.__socket.sendall(msg.encode("ascii"))
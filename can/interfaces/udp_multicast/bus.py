@@ -4,13 +4,14 @@ import select
 import socket
 import struct
 import warnings
-from typing import List, Optional, Tuple, Union
+from collections import deque
+from typing import Deque, List, Optional, Sequence, Tuple, Union
 
 import can
 from can import BusABC, CanProtocol
 from can.typechecking import AutoDetectedConfig
 
-from .utils import check_msgpack_installed, pack_message, unpack_message
+from .utils import check_msgpack_installed, pack_message, unpack_messages
 
 try:
     from fcntl import ioctl
@@ -112,6 +113,9 @@ class UdpMulticastBus(BusABC):
         self._multicast = GeneralPurposeUdpMulticastBus(channel, port, hop_limit)
         self._can_protocol = CanProtocol.CAN_FD if fd else CanProtocol.CAN_20
 
+        # a single datagram may carry several messages, see send_batch()
+        self._rx_buffer: Deque[can.Message] = deque()
+
     @property
     def is_fd(self) -> bool:
         warnings.warn(
@@ -122,13 +126,31 @@ class UdpMulticastBus(BusABC):
         return self._can_protocol is CanProtocol.CAN_FD
 
     def _recv_internal(self, timeout: Optional[float]):
+        if not self._rx_buffer:
+            self._receive_datagram(timeout)
+
+        if self._rx_buffer:
+            return self._rx_buffer.popleft(), False
+        return None, False
+
+    def _recv_batch_internal(self, max_messages: int, timeout: Optional[float]):
+        if not self._rx_buffer:
+            self._receive_datagram(timeout)
+
+        msgs = []
+        while self._rx_buffer and len(msgs) < max_messages:
+            msgs.append(self._rx_buffer.popleft())
+        return msgs, False
+
+    def _receive_datagram(self, timeout: Optional[float]) -> None:
+        """Receive a single datagram and put all messages contained in it into the receive buffer."""
         result = self._multicast.recv(timeout)
         if not result:
-            return None, False
+            return
 
         data, _, timestamp = result
         try:
-            can_message = unpack_message(
+            can_messages = unpack_messages(
                 data, replace={"timestamp": timestamp}, check=True
             )
         except Exception as exception:
@@ -136,10 +158,10 @@ class UdpMulticastBus(BusABC):
                 "could not unpack received message"
             ) from exception
 
-        if self._can_protocol is not CanProtocol.CAN_FD and can_message.is_fd:
-            return None, False
-
-        return can_message, False
+        for can_message in can_messages:
+            if self._can_protocol is not CanProtocol.CAN_FD and can_message.is_fd:
+                continue
+            self._rx_buffer.append(can_message)
 
     def send(self, msg: can.Message, timeout: Optional[float] = None) -> None:
         if self._can_protocol is not CanProtocol.CAN_FD and msg.is_fd:
@@ -150,6 +172,46 @@ class UdpMulticastBus(BusABC):
         data = pack_message(msg)
         self._multicast.send(data, timeout)
 
+    def send_batch(
+        self, msgs: Sequence[can.Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages, packing as many of them as possible into each datagram.
+
+        .. note::
+            Datagrams carrying more than one message can only be decoded by
+            receivers that support this as well.
+        """
+        if self._can_protocol is not CanProtocol.CAN_FD and any(
+            msg.is_fd for msg in msgs
+        ):
+            raise can.CanOperationError(
+                "cannot send FD message over bus with CAN FD disabled"
+            )
+
+        # pack as many messages into each datagram as a receiver reads at once
+        datagrams: List[List[bytes]] = []
+        datagram_size = 0
+        for msg in msgs:
+            data = pack_message(msg)
+            if not datagrams or datagram_size + len(data) > self._multicast.max_buffer:
+                datagrams.append([])
+                datagram_size = 0
+            datagrams[-1].append(data)
+            datagram_size += len(data)
+
+        sent = 0
+        for datagram in datagrams:
+            try:
+                self._multicast.send(b"".join(datagram), timeout)
+            except can.CanError:
+                if not sent:
+                    raise
+                log.debug("Sending stopped after %d of %d messages", sent, len(msgs))
+                break
+            sent += len(datagram)
+
+        return sent
+
     def fileno(self) -> int:
         """Provides the internally used file descriptor of the socket or `-1` if not available."""
         return self._multicast.fileno()
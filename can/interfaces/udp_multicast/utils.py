@@ -2,7 +2,7 @@
 Defines common functions.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from can import CanInterfaceNotImplementedError, Message
 from can.typechecking import ReadableBytesLike
@@ -63,3 +63,23 @@ def unpack_message(
     if replace is not None:
         as_dict.update(replace)
     return Message(check=check, **as_dict)
+
+
+def unpack_messages(
+    data: ReadableBytesLike,
+    replace: Optional[Dict[str, Any]] = None,
+    check: bool = False,
+) -> List[Message]:
+    """Unpack all can.Messages from a byte blob of concatenated msgpack objects.
+
+    See :func:`unpack_message` for the parameters and possible exceptions.
+    """
+    check_msgpack_installed()
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(data)
+    messages = []
+    for as_dict in unpacker:
+        if replace is not None:
+            as_dict.update(replace)
+        messages.append(Message(check=check, **as_dict))
+    return messages
@@ -6,6 +6,7 @@ Authors: Julien Grave <grave.jul@gmail.com>, Christian Sandberg
 
 import contextlib
 import ctypes
+import itertools
 import logging
 import os
 import time
@@ -787,6 +788,26 @@ class VectorBus(BusABC):
     def send(self, msg: Message, timeout: Optional[float] = None) -> None:
         self._send_sequence([msg])
 
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        sent = 0
+        # the driver transmits all events of one call on the same channel mask,
+        # so consecutive messages for the same channel are grouped together
+        for _, group in itertools.groupby(msgs, key=lambda msg: msg.channel):
+            group_msgs = list(group)
+            try:
+                group_sent = self._send_sequence(group_msgs)
+            except VectorOperationError:
+                if not sent:
+                    raise
+                LOG.debug("Sending stopped after %d of %d messages", sent, len(msgs))
+                return sent
+            sent += group_sent
+            if group_sent < len(group_msgs):
+                break
+        return sent
+
     def _send_sequence(self, msgs: Sequence[Message]) -> int:
         """Send messages and return number of successful transmissions."""
         if self._can_protocol is CanProtocol.CAN_FD:
@@ -795,8 +816,9 @@ class VectorBus(BusABC):
             return self._send_can_msg_sequence(msgs)
 
     def _get_tx_channel_mask(self, msgs: Sequence[Message]) -> int:
-        if len(msgs) == 1:
-            return self.channel_masks.get(msgs[0].channel, self.mask)  # type: ignore[arg-type]
+        channel = msgs[0].channel
+        if all(msg.channel == channel for msg in msgs[1:]):
+            return self.channel_masks.get(channel, self.mask)  # type: ignore[arg-type]
         else:
             return self.mask
 
@@ -12,7 +12,7 @@ import time
 from copy import deepcopy
 from random import randint
 from threading import RLock
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 from can import CanOperationError
 from can.bus import BusABC, CanProtocol
@@ -31,6 +31,35 @@ else:
 channels_lock = RLock()
 
 
+def _put_all(
+    bus_queue: "queue.Queue[Message]", msgs: List[Message], timeout: Optional[float]
+) -> bool:
+    """Put all messages into a queue while acquiring its lock only once.
+
+    This mirrors :meth:`queue.Queue.put` with ``block=True``.
+
+    :return: ``False`` if the queue was still full after the timeout expired
+    """
+    with bus_queue.not_full:
+        end_time = None if timeout is None else time.monotonic() + timeout
+        for msg in msgs:
+            if bus_queue.maxsize > 0:
+                while (
+                    bus_queue._qsize() >= bus_queue.maxsize
+                ):  # pylint: disable=protected-access
+                    if end_time is None:
+                        bus_queue.not_full.wait()
+                        continue
+                    remaining = end_time - time.monotonic()
+                    if remaining <= 0.0:
+                        return False
+                    bus_queue.not_full.wait(remaining)
+            bus_queue._put(msg)  # pylint: disable=protected-access
+            bus_queue.unfinished_tasks += 1
+            bus_queue.not_empty.notify()
+    return True
+
+
 class VirtualBus(BusABC):
     """
     A virtual CAN bus using an internal message queue. It can be used for
@@ -134,6 +163,23 @@ class VirtualBus(BusABC):
         else:
             return msg, False
 
+    def _recv_batch_internal(
+        self, max_messages: int, timeout: Optional[float]
+    ) -> Tuple[List[Message], bool]:
+        self._check_if_open()
+        try:
+            msgs = [self.queue.get(block=True, timeout=timeout)]
+        except queue.Empty:
+            return [], False
+
+        # drain everything that is already queued without blocking again
+        try:
+            while len(msgs) < max_messages:
+                msgs.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+        return msgs, False
+
     def send(self, msg: Message, timeout: Optional[float] = None) -> None:
         self._check_if_open()
 
@@ -155,6 +201,40 @@ class VirtualBus(BusABC):
         if not all_sent:
             raise CanOperationError("Could not send message to one or more recipients")
 
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages at once.
+
+        The queue of each receiver is locked only once per batch. The timeout
+        applies to each receiver individually, like for :meth:`send`.
+
+        :raises ~can.exceptions.CanOperationError:
+            If the messages could not be put into the queue of every receiver.
+        """
+        self._check_if_open()
+
+        now = time.time()
+        # Add messages to all listening on this channel
+        all_sent = True
+        for bus_queue in self.channel:
+            if bus_queue is self.queue and not self.receive_own_messages:
+                continue
+            is_rx = bus_queue is not self.queue
+            msg_copies = []
+            for msg in msgs:
+                msg_copy = deepcopy(msg)
+                msg_copy.timestamp = msg.timestamp if self.preserve_timestamps else now
+                msg_copy.channel = self.channel_id
+                msg_copy.is_rx = is_rx
+                msg_copies.append(msg_copy)
+            if not _put_all(bus_queue, msg_copies, timeout):
+                all_sent = False
+
+        if not all_sent:
+            raise CanOperationError("Could not send messages to one or more recipients")
+        return len(msgs)
+
     def shutdown(self) -> None:
         super().shutdown()
         if self._open:
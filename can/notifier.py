@@ -3,10 +3,26 @@ This module contains the implementation of :class:`~can.Notifier`.
 """
 
 import asyncio
+import bisect
 import logging
+import selectors
 import threading
 import time
-from typing import Awaitable, Callable, Iterable, List, Optional, Union
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from can.bus import BusABC
 from can.listener import Listener
@@ -16,6 +32,225 @@ logger = logging.getLogger("can.Notifier")
 
 MessageRecipient = Union[Listener, Callable[[Message], Union[Awaitable[None], None]]]
 
+#: Maximum number of messages that are read from a bus at once
+_MAX_BATCH_SIZE = 64
+
+
+class OverflowPolicy(Enum):
+    """What to do with a message for a listener whose queue is full."""
+
+    #: Wait until the listener has made room, this slows down the reception
+    BLOCK = "block"
+
+    #: Discard the oldest queued message to make room for the new one
+    DROP_OLDEST = "drop_oldest"
+
+    #: Discard the new message
+    DROP_NEWEST = "drop_newest"
+
+
+#: Upper bounds in seconds of the buckets of :attr:`LatencyStats.histogram`,
+#: the last bucket holds all larger values
+LATENCY_BUCKETS: Tuple[float, ...] = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """Summary of a series of latencies in seconds."""
+
+    #: Number of recorded values
+    count: int
+    #: Sum of all recorded values
+    total: float
+    #: Smallest recorded value, ``0.0`` if there are none
+    minimum: float
+    #: Largest recorded value, ``0.0`` if there are none
+    maximum: float
+    #: Number of values per bucket of :data:`LATENCY_BUCKETS`, plus one
+    #: bucket for the values above the last bound
+    histogram: Tuple[int, ...]
+
+    @property
+    def mean(self) -> float:
+        """The average of all recorded values, ``0.0`` if there are none."""
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True)
+class ListenerStats:
+    """Statistics of a single listener of a :class:`~can.Notifier`."""
+
+    #: Number of messages handed to the listener
+    calls: int
+    #: Time spent in the listener per message
+    callback_latency: LatencyStats
+    #: Time between :attr:`~can.Message.timestamp` and the start of the call
+    delivery_latency: LatencyStats
+
+
+@dataclass(frozen=True)
+class NotifierStats:
+    """A snapshot of the statistics collected by :meth:`can.Notifier.stats`."""
+
+    #: Number of received messages per bus
+    received: Dict[BusABC, int]
+    #: Statistics per listener
+    listeners: Dict[MessageRecipient, ListenerStats]
+
+
+class _LatencyRecorder:
+    __slots__ = ("count", "total", "minimum", "maximum", "histogram")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+
+    def snapshot(self) -> LatencyStats:
+        if not self.count:
+            return LatencyStats(0, 0.0, 0.0, 0.0, tuple(self.histogram))
+        return LatencyStats(
+            self.count,
+            self.total,
+            self.minimum,
+            self.maximum,
+            tuple(self.histogram),
+        )
+
+
+class _ListenerRecorder:
+    __slots__ = ("callback_latency", "delivery_latency")
+
+    def __init__(self) -> None:
+        self.callback_latency = _LatencyRecorder()
+        self.delivery_latency = _LatencyRecorder()
+
+
+class _StatsRecorder:
+    """Collects the statistics of a notifier.
+
+    Every counter is only updated by a single thread at a time: the bus counts
+    by the thread reading the bus and the listener statistics by the thread
+    calling the listener.
+    """
+
+    def __init__(self) -> None:
+        self.received: Dict[BusABC, int] = {}
+        self.listeners: Dict[MessageRecipient, _ListenerRecorder] = {}
+
+    def count_received(self, bus: BusABC, count: int) -> None:
+        self.received[bus] = self.received.get(bus, 0) + count
+
+    def call(self, listener: MessageRecipient, msg: Message) -> Any:
+        recorder = self.listeners.get(listener)
+        if recorder is None:
+            recorder = self.listeners.setdefault(listener, _ListenerRecorder())
+        recorder.delivery_latency.add(time.time() - msg.timestamp)
+        start = time.perf_counter()
+        try:
+            return listener(msg)
+        finally:
+            recorder.callback_latency.add(time.perf_counter() - start)
+
+    def snapshot(self) -> NotifierStats:
+        return NotifierStats(
+            received=dict(self.received),
+            listeners={
+                listener: ListenerStats(
+                    calls=recorder.callback_latency.count,
+                    callback_latency=recorder.callback_latency.snapshot(),
+                    delivery_latency=recorder.delivery_latency.snapshot(),
+                )
+                for listener, recorder in list(self.listeners.items())
+            },
+        )
+
+
+class _ListenerWorker:
+    """Feeds a single listener from a bounded queue in a thread of its own."""
+
+    def __init__(
+        self,
+        listener: MessageRecipient,
+        queue_size: int,
+        overflow_policy: OverflowPolicy,
+        on_error: Callable[[Exception], None],
+        stats: Optional[_StatsRecorder] = None,
+    ) -> None:
+        self.listener = listener
+
+        #: Number of messages discarded because the queue was full
+        self.dropped = 0
+
+        self._queue: Deque[Message] = deque()
+        self._queue_size = queue_size
+        self._overflow_policy = overflow_policy
+        self._on_error = on_error
+        self._stats = stats
+        self._condition = threading.Condition()
+        self._running = True
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"can.notifier worker for {listener!r}"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def put(self, msg: Message) -> None:
+        with self._condition:
+            if len(self._queue) >= self._queue_size:
+                if self._overflow_policy is OverflowPolicy.BLOCK:
+                    while self._running and len(self._queue) >= self._queue_size:
+                        self._condition.wait()
+                    if not self._running:
+                        self.dropped += 1
+                        return
+                elif self._overflow_policy is OverflowPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    self.dropped += 1
+                    return
+            self._queue.append(msg)
+            self._condition.notify_all()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Delivers all queued messages and waits for the worker to finish."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._queue:
+                    # stopped and all messages were delivered
+                    return
+                msg = self._queue.popleft()
+                # wake up a receive thread waiting for room
+                self._condition.notify_all()
+            try:
+                if self._stats is None:
+                    self.listener(msg)
+                else:
+                    self._stats.call(self.listener, msg)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._on_error(exc)
+
 
 class Notifier:
     def __init__(
@@ -24,6 +259,10 @@ class Notifier:
         listeners: Iterable[MessageRecipient],
         timeout: float = 1.0,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        multiplex: bool = False,
+        queue_size: int = 0,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        collect_stats: bool = False,
     ) -> None:
         """Manages the distribution of :class:`~can.Message` instances to listeners.
 
@@ -41,11 +280,42 @@ class Notifier:
             and return nothing.
         :param timeout: An optional maximum number of seconds to wait for any :class:`~can.Message`.
         :param loop: An :mod:`asyncio` event loop to schedule the ``listeners`` in.
+        :param multiplex:
+            If ``True`` and no ``loop`` is given, all buses that provide a
+            :meth:`~can.BusABC.fileno` are watched with a :mod:`selectors`
+            based single thread instead of one thread per bus. Buses without a
+            file descriptor still get a thread of their own.
+        :param queue_size:
+            If greater than zero, every listener gets a queue holding up to
+            this many messages and a worker thread of its own, so a slow
+            listener does not hold up the reception or the other listeners.
+            By default, the listeners are called directly by the receiving
+            thread. Cannot be combined with ``loop``.
+        :param overflow_policy:
+            What to do with a message for a listener whose queue is full.
+            The discarded messages are counted by :meth:`dropped_messages`.
+        :param collect_stats:
+            Count the received messages and measure the latencies of
+            the listeners, see :meth:`stats`.
+        :raises ValueError: if ``queue_size`` is negative or combined with ``loop``
         """
+        if queue_size < 0:
+            raise ValueError("queue_size must not be negative")
+        if queue_size and loop is not None:
+            raise ValueError("queue_size cannot be combined with an event loop")
+
         self.listeners: List[MessageRecipient] = list(listeners)
         self.bus = bus
         self.timeout = timeout
         self._loop = loop
+        self._queue_size = queue_size
+        self._overflow_policy = OverflowPolicy(overflow_policy)
+        self._stats: Optional[_StatsRecorder] = (
+            _StatsRecorder() if collect_stats else None
+        )
+        self._multiplex = multiplex
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._selector_thread: Optional[threading.Thread] = None
 
         #: Exception raised in thread
         self.exception: Optional[Exception] = None
@@ -53,6 +323,10 @@ class Notifier:
         self._running = True
         self._lock = threading.Lock()
 
+        self._workers: List[_ListenerWorker] = []
+        if queue_size:
+            self._workers = [self._create_worker(each) for each in self.listeners]
+
         self._readers: List[Union[int, threading.Thread]] = []
         buses = self.bus if isinstance(self.bus, list) else [self.bus]
         for each_bus in buses:
@@ -75,6 +349,9 @@ class Notifier:
             # Use bus file descriptor to watch for messages
             self._loop.add_reader(reader, self._on_message_available, bus)
             self._readers.append(reader)
+        elif self._multiplex and reader >= 0 and self._add_to_selector(bus, reader):
+            # The bus is served by the shared selector thread
+            pass
         else:
             reader_thread = threading.Thread(
                 target=self._rx_thread,
@@ -85,6 +362,34 @@ class Notifier:
             reader_thread.start()
             self._readers.append(reader_thread)
 
+    def _add_to_selector(self, bus: BusABC, fileno: int) -> bool:
+        """Registers the bus with the selector and starts the selector thread if necessary.
+
+        Buses that are added while the thread is waiting are watched
+        after at most ``timeout`` seconds.
+
+        :returns: ``False`` if the file descriptor cannot be watched by a selector.
+        """
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+        try:
+            self._selector.register(fileno, selectors.EVENT_READ, bus)
+        except (OSError, ValueError) as error:
+            # e.g. the select() based selector on Windows only supports sockets
+            logger.debug("Cannot watch %s with a selector: %s", bus, error)
+            return False
+
+        if self._selector_thread is None:
+            self._selector_thread = threading.Thread(
+                target=self._rx_selector_thread,
+                args=(self._selector,),
+                name="can.notifier for multiplexed buses",
+            )
+            self._selector_thread.daemon = True
+            self._selector_thread.start()
+            self._readers.append(self._selector_thread)
+        return True
+
     def stop(self, timeout: float = 5) -> None:
         """Stop notifying Listeners when new :class:`~can.Message` objects arrive
         and call :meth:`~can.Listener.stop` on each Listener.
@@ -103,6 +408,8 @@ class Notifier:
             elif self._loop:
                 # reader is a file descriptor
                 self._loop.remove_reader(reader)
+        for worker in self._workers:
+            worker.stop(max(end_time - time.time(), 0))
         for listener in self.listeners:
             if hasattr(listener, "stop"):
                 listener.stop()
@@ -110,34 +417,79 @@ class Notifier:
     def _rx_thread(self, bus: BusABC) -> None:
         try:
             while self._running:
-                if msg := bus.recv(self.timeout):
+                if msgs := bus.recv_batch(timeout=self.timeout):
+                    if self._stats is not None:
+                        self._stats.count_received(bus, len(msgs))
                     with self._lock:
-                        if self._loop is not None:
-                            self._loop.call_soon_threadsafe(
-                                self._on_message_received, msg
-                            )
-                        else:
-                            self._on_message_received(msg)
+                        for msg in msgs:
+                            if self._loop is not None:
+                                self._loop.call_soon_threadsafe(
+                                    self._on_message_received, msg
+                                )
+                            else:
+                                self._on_message_received(msg)
         except Exception as exc:  # pylint: disable=broad-except
-            self.exception = exc
-            if self._loop is not None:
-                self._loop.call_soon_threadsafe(self._on_error, exc)
-                # Raise anyway
+            if not self._handle_rx_exception(exc):
                 raise
-            elif not self._on_error(exc):
-                # If it was not handled, raise the exception here
+
+    def _rx_selector_thread(self, selector: selectors.BaseSelector) -> None:
+        try:
+            while self._running:
+                for key, _ in selector.select(self.timeout):
+                    self._on_bus_readable(key.data)
+        except Exception as exc:  # pylint: disable=broad-except
+            if not self._handle_rx_exception(exc):
                 raise
-            else:
-                # It was handled, so only log it
-                logger.info("suppressed exception: %s", exc)
+        finally:
+            selector.close()
+
+    def _on_bus_readable(self, bus: BusABC) -> None:
+        # a bus may buffer more messages internally than a single call returns,
+        # and its file descriptor will not become readable again for those
+        while True:
+            msgs = bus.recv_batch(max_messages=_MAX_BATCH_SIZE, timeout=0)
+            if msgs:
+                if self._stats is not None:
+                    self._stats.count_received(bus, len(msgs))
+                with self._lock:
+                    for msg in msgs:
+                        self._on_message_received(msg)
+            if len(msgs) < _MAX_BATCH_SIZE:
+                return
+
+    def _handle_rx_exception(self, exc: Exception) -> bool:
+        """Handles an exception raised in a receive thread.
+
+        :returns: ``True`` if the exception was handled and does not need to be raised.
+        """
+        self.exception = exc
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._on_error, exc)
+            # Raise anyway
+            return False
+        elif not self._on_error(exc):
+            # If it was not handled, raise the exception here
+            return False
+        else:
+            # It was handled, so only log it
+            logger.info("suppressed exception: %s", exc)
+            return True
 
     def _on_message_available(self, bus: BusABC) -> None:
-        if msg := bus.recv(0):
+        msgs = bus.recv_batch(timeout=0)
+        if self._stats is not None:
+            self._stats.count_received(bus, len(msgs))
+        for msg in msgs:
             self._on_message_received(msg)
 
     def _on_message_received(self, msg: Message) -> None:
+        if self._workers:
+            for worker in self._workers:
+                worker.put(msg)
+            return
+        stats = self._stats
         for callback in self.listeners:
-            res = callback(msg)
+            res = callback(msg) if stats is None else stats.call(callback, msg)
             if res and self._loop and asyncio.iscoroutine(res):
                 # Schedule coroutine
                 self._loop.create_task(res)
@@ -160,6 +512,53 @@ class Notifier:
 
         return was_handled
 
+    def _create_worker(self, listener: MessageRecipient) -> _ListenerWorker:
+        return _ListenerWorker(
+            listener,
+            self._queue_size,
+            self._overflow_policy,
+            self._on_worker_error,
+            self._stats,
+        )
+
+    def _on_worker_error(self, exc: Exception) -> None:
+        # must not take the lock, a receive thread might wait for this worker
+        self.exception = exc
+        if self._on_error(exc):
+            logger.info("suppressed exception: %s", exc)
+        else:
+            # the other listeners keep receiving messages
+            logger.error("exception in listener worker", exc_info=exc)
+
+    def stats(self) -> NotifierStats:
+        """Returns a snapshot of the statistics collected so far.
+
+        The latencies of a listener cover the synchronous part of the call,
+        coroutines returned by a listener are measured until they are
+        scheduled. The delivery latency is only meaningful if the
+        interface uses :func:`time.time` as the base of its timestamps.
+
+        :raises RuntimeError: if the notifier was created without ``collect_stats``
+        """
+        if self._stats is None:
+            raise RuntimeError("statistics are only collected with collect_stats=True")
+        return self._stats.snapshot()
+
+    def dropped_messages(self, listener: MessageRecipient) -> int:
+        """Returns how many messages were discarded for a listener because
+        its queue was full, see the ``queue_size`` parameter.
+
+        :param listener: A listener of this notifier
+        :return: The number of discarded messages, always 0 without queues
+        :raises ValueError: if `listener` is not part of this notifier
+        """
+        if listener not in self.listeners:
+            raise ValueError(f"{listener!r} is not a listener of this notifier")
+        for worker in self._workers:
+            if worker.listener == listener:
+                return worker.dropped
+        return 0
+
     def add_listener(self, listener: MessageRecipient) -> None:
         """Add new Listener to the notification list.
         If it is already present, it will be called two times
@@ -167,6 +566,10 @@ class Notifier:
 
         :param listener: Listener to be added to the list to be notified
         """
+        if self._queue_size:
+            worker = self._create_worker(listener)
+            with self._lock:
+                self._workers.append(worker)
         self.listeners.append(listener)
 
     def remove_listener(self, listener: MessageRecipient) -> None:
@@ -178,3 +581,9 @@ class Notifier:
         :raises ValueError: if `listener` was never added to this notifier
         """
         self.listeners.remove(listener)
+        for worker in self._workers:
+            if worker.listener == listener:
+                with self._lock:
+                    self._workers.remove(worker)
+                worker.stop()
+                break
@@ -9,13 +9,22 @@ import argparse
 import errno
 import sys
 from datetime import datetime
-from typing import Iterable, cast
+from typing import Iterable, List, cast
 
-from can import LogReader, Message, MessageSync
+from can import BusABC, CanOperationError, LogReader, Message, MessageSync
 
 from .logger import _create_base_argument_parser, _create_bus, _parse_additional_config
 
 
+def _send_batch(bus: BusABC, msgs: List[Message]) -> None:
+    """Sends all messages, even if the bus accepts only parts of the batch at a time."""
+    while msgs:
+        sent = bus.send_batch(msgs)
+        if not sent:
+            raise CanOperationError("The bus did not accept any message")
+        msgs = msgs[sent:]
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Replay CAN traffic.")
 
@@ -41,7 +50,8 @@ def main() -> None:
     parser.add_argument(
         "--ignore-timestamps",
         dest="timestamps",
-        help="""Ignore timestamps (send all frames immediately with minimum gap between frames)""",
+        help="""Ignore timestamps (send all frames immediately with minimum gap between frames).
+                        Together with a gap of 0, the frames are sent to the interface in batches""",
         action="store_false",
     )
 
@@ -96,13 +106,24 @@ def main() -> None:
 
             print(f"Can LogReader (Started on {datetime.now()})")
 
+            # without any delays between the frames, they can be sent in batches
+            batch_size = 1 if results.timestamps or results.gap else 64
+            batch: List[Message] = []
+
             try:
                 for message in in_sync:
                     if message.is_error_frame and not error_frames:
                         continue
                     if verbosity >= 3:
                         print(message)
-                    bus.send(message)
+                    if batch_size == 1:
+                        bus.send(message)
+                        continue
+                    batch.append(message)
+                    if len(batch) >= batch_size:
+                        _send_batch(bus, batch)
+                        batch.clear()
+                _send_batch(bus, batch)
             except KeyboardInterrupt:
                 pass
 
@@ -52,12 +52,26 @@ class ThreadSafeBus(ObjectProxy):  # pylint: disable=abstract-method
         with self._lock_recv:
             return self.__wrapped__.recv(timeout=timeout, *args, **kwargs)
 
+    def recv_batch(
+        self, max_messages=64, timeout=None, *args, **kwargs
+    ):  # pylint: disable=keyword-arg-before-vararg
+        with self._lock_recv:
+            return self.__wrapped__.recv_batch(
+                max_messages=max_messages, timeout=timeout, *args, **kwargs
+            )
+
     def send(
         self, msg, timeout=None, *args, **kwargs
     ):  # pylint: disable=keyword-arg-before-vararg
         with self._lock_send:
             return self.__wrapped__.send(msg, timeout=timeout, *args, **kwargs)
 
+    def send_batch(
+        self, msgs, timeout=None, *args, **kwargs
+    ):  # pylint: disable=keyword-arg-before-vararg
+        with self._lock_send:
+            return self.__wrapped__.send_batch(msgs, timeout=timeout, *args, **kwargs)
+
     # send_periodic does not need a lock, since the underlying
     # `send` method is already synchronized
 
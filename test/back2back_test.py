@@ -143,6 +143,23 @@ class Back2BackTestCase(unittest.TestCase):
         msg = can.Message(is_extended_id=False, arbitration_id=0x300, data=[4, 5, 6])
         self._send_and_receive(msg)
 
+    def test_send_and_receive_batch(self):
+        msgs = [
+            can.Message(is_extended_id=False, arbitration_id=0x400 + i, data=[i])
+            for i in range(10)
+        ]
+        self.assertEqual(self.bus1.send_batch(msgs), len(msgs))
+
+        recv_msgs = []
+        while len(recv_msgs) < len(msgs):
+            batch = self.bus2.recv_batch(timeout=self.TIMEOUT)
+            if not batch:
+                break
+            recv_msgs.extend(batch)
+        self.assertEqual(len(recv_msgs), len(msgs))
+        for recv_msg, msg in zip(recv_msgs, msgs):
+            self._check_received_message(recv_msg, msg)
+
     @unittest.skip(
         "TODO: how shall this be treated if sending messages locally? should be done uniformly"
     )
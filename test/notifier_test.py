@@ -1,12 +1,45 @@
 #!/usr/bin/env python
 
 import asyncio
+import select
+import socket
+import threading
 import time
 import unittest
 
 import can
 
 
+class SocketPairBus(can.BusABC):
+    """A bus that provides a file descriptor and receives single byte arbitration IDs."""
+
+    def __init__(self, channel):
+        self._rx_socket, self._tx_socket = socket.socketpair()
+        super().__init__(channel=channel)
+        self.channel_info = f"socket pair {channel}"
+
+    def _recv_internal(self, timeout):
+        ready, _, _ = select.select([self._rx_socket], [], [], timeout)
+        if not ready:
+            return None, False
+        arbitration_id = self._rx_socket.recv(1)[0]
+        return (
+            can.Message(arbitration_id=arbitration_id, channel=self.channel_info),
+            False,
+        )
+
+    def send(self, msg, timeout=None):
+        self._tx_socket.send(bytes([msg.arbitration_id]))
+
+    def fileno(self):
+        return self._rx_socket.fileno()
+
+    def shutdown(self):
+        super().shutdown()
+        self._rx_socket.close()
+        self._tx_socket.close()
+
+
 class NotifierTest(unittest.TestCase):
     def test_single_bus(self):
         with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
@@ -34,6 +67,152 @@ class NotifierTest(unittest.TestCase):
                 self.assertEqual(recv_msg.channel, 1)
                 notifier.stop()
 
+    def test_multiplexed_buses(self):
+        with SocketPairBus(0) as bus1, SocketPairBus(1) as bus2, can.Bus(
+            2, interface="virtual", receive_own_messages=True
+        ) as bus3:
+            reader = can.BufferedReader()
+            threads_before = threading.active_count()
+            notifier = can.Notifier([bus1, bus2, bus3], [reader], 0.1, multiplex=True)
+            # one thread for both buses with a file descriptor, one for the virtual bus
+            self.assertEqual(threading.active_count() - threads_before, 2)
+
+            for i in range(3):
+                bus1.send(can.Message(arbitration_id=i))
+                bus2.send(can.Message(arbitration_id=0x10 + i))
+            bus3.send(can.Message(arbitration_id=0x20))
+
+            received = [reader.get_message(1) for _ in range(7)]
+            self.assertNotIn(None, received)
+            ids = sorted(msg.arbitration_id for msg in received)
+            self.assertEqual(ids, [0, 1, 2, 0x10, 0x11, 0x12, 0x20])
+            notifier.stop()
+            self.assertEqual(threading.active_count(), threads_before)
+
+    def test_listener_queues(self):
+        with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+            fast_reader = can.BufferedReader()
+            slow_reader = can.BufferedReader()
+            release = threading.Event()
+
+            def slow_listener(msg):
+                release.wait()
+                slow_reader(msg)
+
+            notifier = can.Notifier(
+                bus,
+                [fast_reader, slow_listener],
+                0.1,
+                queue_size=2,
+                overflow_policy=can.OverflowPolicy.DROP_OLDEST,
+            )
+            for i in range(10):
+                bus.send(can.Message(arbitration_id=i))
+                time.sleep(0.01)
+
+            # the slow listener does not hold up the fast one
+            received = [fast_reader.get_message(1) for _ in range(10)]
+            self.assertNotIn(None, received)
+            self.assertEqual(notifier.dropped_messages(fast_reader), 0)
+
+            release.set()
+            notifier.stop()
+            # one message is being delivered, two are queued and the rest dropped
+            self.assertEqual(notifier.dropped_messages(slow_listener), 7)
+            ids = []
+            while (msg := slow_reader.get_message(0)) is not None:
+                ids.append(msg.arbitration_id)
+            self.assertEqual(ids, [0, 8, 9])
+
+    def test_listener_queues_drop_newest(self):
+        with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+            reader = can.BufferedReader()
+            release = threading.Event()
+
+            def slow_listener(msg):
+                release.wait()
+                reader(msg)
+
+            notifier = can.Notifier(
+                bus, [slow_listener], 0.1, queue_size=2, overflow_policy="drop_newest"
+            )
+            for i in range(10):
+                bus.send(can.Message(arbitration_id=i))
+                time.sleep(0.01)
+            release.set()
+            notifier.stop()
+            self.assertEqual(notifier.dropped_messages(slow_listener), 7)
+            ids = []
+            while (msg := reader.get_message(0)) is not None:
+                ids.append(msg.arbitration_id)
+            self.assertEqual(ids, [0, 1, 2])
+
+    def test_listener_queues_block(self):
+        with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+            reader = can.BufferedReader()
+            notifier = can.Notifier(bus, [], 0.1, queue_size=1)
+            notifier.add_listener(reader)
+            for i in range(20):
+                bus.send(can.Message(arbitration_id=i))
+            notifier.stop()
+            self.assertEqual(notifier.dropped_messages(reader), 0)
+            received = [reader.get_message(0) for _ in range(20)]
+            self.assertEqual([msg.arbitration_id for msg in received], list(range(20)))
+            with self.assertRaises(ValueError):
+                notifier.dropped_messages(can.Printer())
+
+    def test_listener_queues_with_loop(self):
+        with can.Bus("test", interface="virtual") as bus:
+            with self.assertRaises(ValueError):
+                can.Notifier(bus, [], loop=asyncio.new_event_loop(), queue_size=10)
+
+    def test_stats(self):
+        with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+            reader = can.BufferedReader()
+            notifier = can.Notifier(bus, [reader], 0.1, collect_stats=True)
+            for i in range(5):
+                bus.send(can.Message(arbitration_id=i))
+            for _ in range(5):
+                self.assertIsNotNone(reader.get_message(1))
+            notifier.stop()
+
+            stats = notifier.stats()
+            self.assertEqual(stats.received, {bus: 5})
+            listener_stats = stats.listeners[reader]
+            self.assertEqual(listener_stats.calls, 5)
+            for latency in (
+                listener_stats.callback_latency,
+                listener_stats.delivery_latency,
+            ):
+                self.assertEqual(latency.count, 5)
+                self.assertEqual(sum(latency.histogram), 5)
+                self.assertEqual(
+                    len(latency.histogram), len(can.notifier.LATENCY_BUCKETS) + 1
+                )
+                self.assertGreaterEqual(latency.minimum, 0.0)
+                self.assertLessEqual(latency.minimum, latency.mean)
+                self.assertLessEqual(latency.mean, latency.maximum)
+
+    def test_stats_with_listener_queues(self):
+        with SocketPairBus(0) as bus:
+            reader = can.BufferedReader()
+            notifier = can.Notifier(
+                bus, [reader], 0.1, multiplex=True, queue_size=10, collect_stats=True
+            )
+            bus.send(can.Message(arbitration_id=1))
+            self.assertIsNotNone(reader.get_message(1))
+            notifier.stop()
+            stats = notifier.stats()
+            self.assertEqual(stats.received, {bus: 1})
+            self.assertEqual(stats.listeners[reader].calls, 1)
+
+    def test_stats_disabled(self):
+        with can.Bus("test", interface="virtual") as bus:
+            notifier = can.Notifier(bus, [], 0.1)
+            with self.assertRaises(RuntimeError):
+                notifier.stats()
+            notifier.stop()
+
 
 class AsyncNotifierTest(unittest.TestCase):
     def test_asyncio_notifier(self):
@@ -50,6 +229,29 @@ class AsyncNotifierTest(unittest.TestCase):
 
         asyncio.run(run_it())
 
+    def test_asyncio_notifier_stats(self):
+        async def run_it():
+            with SocketPairBus(0) as bus:
+                reader = can.AsyncBufferedReader()
+                notifier = can.Notifier(
+                    bus,
+                    [reader],
+                    0.1,
+                    loop=asyncio.get_running_loop(),
+                    collect_stats=True,
+                )
+                bus.send(can.Message(arbitration_id=1))
+                recv_msg = await asyncio.wait_for(reader.get_message(), 0.5)
+                self.assertIsNotNone(recv_msg)
+                notifier.stop()
+
+                stats = notifier.stats()
+                self.assertEqual(stats.received, {bus: 1})
+                self.assertEqual(stats.listeners[reader].calls, 1)
+                self.assertEqual(stats.listeners[reader].delivery_latency.count, 1)
+
+        asyncio.run(run_it())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
 import gc
 from unittest.mock import patch
 
+import pytest
+
 import can
 
 
@@ -21,3 +23,31 @@ def test_bus_attempts_self_cleanup(mock_shutdown):
     del bus
     gc.collect()
     mock_shutdown.assert_called()
+
+
+class _QueueBus(can.BusABC):
+    """Uses the default implementation of _recv_batch_internal."""
+
+    def __init__(self, msgs, **kwargs):
+        self._msgs = list(msgs)
+        super().__init__(channel=None, **kwargs)
+
+    def _recv_internal(self, timeout):
+        if self._msgs:
+            return self._msgs.pop(0), False
+        return None, False
+
+    def send(self, msg, timeout=None):
+        pass
+
+
+def test_recv_batch_default_implementation():
+    msgs = [can.Message(arbitration_id=i) for i in range(10)]
+    with _QueueBus(msgs, can_filters=[{"can_id": 0x1, "can_mask": 0x1}]) as bus:
+        assert [msg.arbitration_id for msg in bus.recv_batch(4, timeout=0)] == [1, 3]
+        assert [msg.arbitration_id for msg in bus.recv_batch(4, timeout=0)] == [5, 7]
+        assert [msg.arbitration_id for msg in bus.recv_batch(4, timeout=0)] == [9]
+        assert bus.recv_batch(4, timeout=0) == []
+
+        with pytest.raises(ValueError):
+            bus.recv_batch(0)
@@ -34,6 +34,22 @@ class TestMessageFiltering(unittest.TestCase):
         assert r.arbitration_id == EXAMPLE_MSG1.arbitration_id
         assert r.data == EXAMPLE_MSG1.data
 
+    def test_recv_batch(self):
+        for i in range(5):
+            self.node2.send(Message(arbitration_id=i))
+        msgs = self.node1.recv_batch(max_messages=3, timeout=0.1)
+        assert [msg.arbitration_id for msg in msgs] == [0, 1, 2]
+        msgs = self.node1.recv_batch(max_messages=3, timeout=0.1)
+        assert [msg.arbitration_id for msg in msgs] == [3, 4]
+        assert self.node1.recv_batch(timeout=0.01) == []
+
+    def test_recv_batch_filtered(self):
+        self.node1.set_filters([{"can_id": 0x2, "can_mask": 0x7FE}])
+        for i in range(5):
+            self.node2.send(Message(arbitration_id=i))
+        msgs = self.node1.recv_batch(timeout=0.1)
+        assert [msg.arbitration_id for msg in msgs] == [2, 3]
+
 
 if __name__ == "__main__":
     unittest.main()
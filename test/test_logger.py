@@ -59,7 +59,9 @@ class TestLoggerScriptModule(unittest.TestCase):
         self.loggerToUse.stop.assert_called_once()
 
     def test_log_virtual(self):
-        self.mock_virtual_bus.recv = Mock(side_effect=[self.testmsg, KeyboardInterrupt])
+        self.mock_virtual_bus.recv_batch = Mock(
+            side_effect=[[self.testmsg], KeyboardInterrupt]
+        )
 
         sys.argv = self.baseargs
         can.logger.main()
@@ -67,7 +69,9 @@ class TestLoggerScriptModule(unittest.TestCase):
         self.mock_logger.assert_called_once()
 
     def test_log_virtual_active(self):
-        self.mock_virtual_bus.recv = Mock(side_effect=[self.testmsg, KeyboardInterrupt])
+        self.mock_virtual_bus.recv_batch = Mock(
+            side_effect=[[self.testmsg], KeyboardInterrupt]
+        )
 
         sys.argv = self.baseargs + ["--active"]
         can.logger.main()
@@ -76,7 +80,9 @@ class TestLoggerScriptModule(unittest.TestCase):
         self.assertEqual(self.mock_virtual_bus.state, can.BusState.ACTIVE)
 
     def test_log_virtual_passive(self):
-        self.mock_virtual_bus.recv = Mock(side_effect=[self.testmsg, KeyboardInterrupt])
+        self.mock_virtual_bus.recv_batch = Mock(
+            side_effect=[[self.testmsg], KeyboardInterrupt]
+        )
 
         sys.argv = self.baseargs + ["--passive"]
         can.logger.main()
@@ -85,7 +91,9 @@ class TestLoggerScriptModule(unittest.TestCase):
         self.assertEqual(self.mock_virtual_bus.state, can.BusState.PASSIVE)
 
     def test_log_virtual_with_config(self):
-        self.mock_virtual_bus.recv = Mock(side_effect=[self.testmsg, KeyboardInterrupt])
+        self.mock_virtual_bus.recv_batch = Mock(
+            side_effect=[[self.testmsg], KeyboardInterrupt]
+        )
 
         sys.argv = self.baseargs + [
             "--bitrate",
@@ -99,7 +107,9 @@ class TestLoggerScriptModule(unittest.TestCase):
         self.mock_logger.assert_called_once()
 
     def test_log_virtual_sizedlogger(self):
-        self.mock_virtual_bus.recv = Mock(side_effect=[self.testmsg, KeyboardInterrupt])
+        self.mock_virtual_bus.recv_batch = Mock(
+            side_effect=[[self.testmsg], KeyboardInterrupt]
+        )
         self.MockLoggerUse = self.MockLoggerSized
         self.loggerToUse = self.mock_logger_sized
 
@@ -172,7 +182,9 @@ class TestLoggerCompressedFile(unittest.TestCase):
         """
         Basic test to verify Logger is able to write gzip files.
         """
-        self.mock_virtual_bus.recv = Mock(side_effect=[self.testmsg, KeyboardInterrupt])
+        self.mock_virtual_bus.recv_batch = Mock(
+            side_effect=[[self.testmsg], KeyboardInterrupt]
+        )
         sys.argv = self.baseargs + ["--file_name", self.testfile.name]
         can.logger.main()
         with gzip.open(self.testfile.name, "rt") as testlog:
@@ -6,7 +6,11 @@ This module tests :meth:`can.BusABC._matches_filters`.
 
 import unittest
 
+import hypothesis.strategies as st
+from hypothesis import given, settings
+
 from can import Bus, Message
+from can._filters import FilterMatcher
 
 from .data.example_data import TEST_ALL_MESSAGES
 
@@ -47,5 +51,74 @@ class TestMessageFiltering(unittest.TestCase):
         self.assertTrue(self.bus._matches_filters(HIGHEST_MSG))
 
 
+def _matches_linear(filters, msg):
+    """The reference implementation: check every filter one after the other."""
+    for _filter in filters:
+        if "extended" in _filter and _filter["extended"] != msg.is_extended_id:
+            continue
+        if (_filter["can_id"] ^ msg.arbitration_id) & _filter["can_mask"] == 0:
+            return True
+    return False
+
+
+# mostly exact and "typical" masks, so that overlapping filters are frequent
+_masks = st.one_of(
+    st.sampled_from([0x0, 0x700, 0x7F0, 0x7FF, 0x1FFFFF00, 0x1FFFFFFF]),
+    st.integers(min_value=0, max_value=0x1FFFFFFF),
+)
+_ids = st.one_of(
+    st.integers(min_value=0, max_value=0x7FF),
+    st.integers(min_value=0, max_value=0x1FFFFFFF),
+)
+_filters = st.lists(
+    st.one_of(
+        st.fixed_dictionaries({"can_id": _ids, "can_mask": _masks}),
+        st.fixed_dictionaries(
+            {"can_id": _ids, "can_mask": _masks, "extended": st.booleans()}
+        ),
+    ),
+    min_size=1,
+    max_size=30,
+)
+_messages = st.builds(
+    Message,
+    arbitration_id=_ids,
+    is_extended_id=st.booleans(),
+    check=st.just(False),
+)
+
+
+class TestFilterMatcher(unittest.TestCase):
+    @given(filters=_filters, msgs=st.lists(_messages, min_size=1, max_size=20))
+    @settings(max_examples=200, deadline=None)
+    def test_equivalent_to_linear_scan(self, filters, msgs):
+        matcher = FilterMatcher(filters)
+        for msg in msgs:
+            self.assertEqual(matcher.matches(msg), _matches_linear(filters, msg))
+
+    @given(filters=_filters)
+    @settings(max_examples=30, deadline=None)
+    def test_equivalent_to_linear_scan_for_all_standard_ids(self, filters):
+        matcher = FilterMatcher(filters)
+        for can_id in range(0x800):
+            msg = Message(arbitration_id=can_id, is_extended_id=False)
+            self.assertEqual(matcher.matches(msg), _matches_linear(filters, msg))
+
+    def test_covered_filters_are_dropped(self):
+        matcher = FilterMatcher(
+            [
+                {"can_id": 0x100, "can_mask": 0x700},
+                {"can_id": 0x123, "can_mask": 0x7FF},
+                {"can_id": 0x123, "can_mask": 0x7FF, "extended": False},
+                {"can_id": 0x234, "can_mask": 0x7FF, "extended": True},
+            ]
+        )
+        self.assertEqual(matcher._standard_table, ((0x700, frozenset({0x100})),))
+        self.assertEqual(
+            matcher._extended_table,
+            ((0x700, frozenset({0x100})), (0x7FF, frozenset({0x234}))),
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -105,6 +105,14 @@ class TestPlayerScriptModule(unittest.TestCase):
         self.assertEqual(self.mock_virtual_bus.send.call_count, 12)
         self.assertSuccessfulCleanup()
 
+    def test_play_virtual_batched(self):
+        self.mock_virtual_bus.send_batch = Mock(side_effect=lambda msgs: len(msgs))
+        sys.argv = self.baseargs + ["--ignore-timestamps", "-g", "0", self.logfile]
+        can.player.main()
+        self.mock_virtual_bus.send.assert_not_called()
+        self.mock_virtual_bus.send_batch.assert_called_once()
+        self.assertSuccessfulCleanup()
+
 
 class TestPlayerCompressedFile(TestPlayerScriptModule):
     """
@@ -4,6 +4,7 @@
 Test functions in `can.interfaces.socketcan.socketcan`.
 """
 import ctypes
+import socket
 import struct
 import unittest
 import warnings
@@ -15,7 +16,9 @@ import can
 from can.interfaces.socketcan.constants import (
     CAN_BCM_TX_DELETE,
     CAN_BCM_TX_SETUP,
+    CANFD_MTU,
     SETTIMER,
+    SO_TIMESTAMPNS,
     STARTTIMER,
     TX_COUNTEVT,
 )
@@ -26,6 +29,7 @@ from can.interfaces.socketcan.socketcan import (
     build_bcm_transmit_header,
     build_bcm_tx_delete_header,
     build_bcm_update_header,
+    build_can_frame,
 )
 
 from .config import IS_LINUX, IS_PYPY
@@ -369,6 +373,61 @@ class SocketCANTest(unittest.TestCase):
         bus = can.Bus(interface="socketcan", channel="vcan0", fd=True)
         self.assertEqual(bus.protocol, can.CanProtocol.CAN_FD)
 
+    @unittest.skipUnless(IS_LINUX, "Only run on Linux")
+    def test_capture_messages(self):
+        from can.interfaces.socketcan.mmsg import RECVMMSG_AVAILABLE, ReceiveBuffer
+        from can.interfaces.socketcan.socketcan import (
+            RECEIVED_ANCILLARY_BUFFER_SIZE,
+            SOCKADDR_CAN_SIZE,
+            capture_message,
+            capture_messages,
+        )
+
+        if not RECVMMSG_AVAILABLE:
+            self.skipTest("recvmmsg() is not available")
+
+        # a datagram socket pair receives the raw frames like a CAN socket
+        tx_socket, rx_socket = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.addCleanup(tx_socket.close)
+        self.addCleanup(rx_socket.close)
+        rx_socket.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+
+        msgs = [
+            can.Message(arbitration_id=0x123, data=[1, 2, 3], is_extended_id=False),
+            can.Message(arbitration_id=0x12345678, is_remote_frame=True, dlc=4),
+            can.Message(arbitration_id=0x7FF, is_extended_id=False, data=range(8)),
+            can.Message(
+                arbitration_id=0x1,
+                is_fd=True,
+                bitrate_switch=True,
+                error_state_indicator=True,
+                data=range(64),
+            ),
+            can.Message(arbitration_id=0x2, is_error_frame=True, dlc=8),
+        ]
+        rx_buffer = ReceiveBuffer(
+            3, CANFD_MTU, RECEIVED_ANCILLARY_BUFFER_SIZE, SOCKADDR_CAN_SIZE
+        )
+
+        for msg in msgs:
+            tx_socket.send(build_can_frame(msg))
+        received = capture_messages(rx_socket, rx_buffer, 3)
+        self.assertEqual(len(received), 3)
+        received += capture_messages(rx_socket, rx_buffer, 3)
+        self.assertEqual(len(received), len(msgs))
+        self.assertEqual(
+            capture_messages(rx_socket, rx_buffer, 3, flags=socket.MSG_DONTWAIT), []
+        )
+
+        for msg in msgs:
+            tx_socket.send(build_can_frame(msg))
+        for msg, batch_msg in zip(msgs, received):
+            single_msg = capture_message(rx_socket)
+            self.assertTrue(batch_msg.equals(single_msg, timestamp_delta=None))
+            self.assertTrue(batch_msg.equals(msg, timestamp_delta=None))
+            self.assertEqual(batch_msg.is_rx, single_msg.is_rx)
+            self.assertGreater(batch_msg.timestamp, 0)
+
     @unittest.skipUnless(IS_LINUX and IS_PYPY, "Only test when run on Linux with PyPy")
     def test_pypy_socketcan_support(self):
         """Wait for PyPy raw CAN socket support
@@ -486,6 +486,25 @@ def test_send_fd_mocked(mock_xldriver) -> None:
     can.interfaces.vector.canlib.xldriver.xlCanTransmitEx.assert_called()
 
 
+def test_send_batch_mocked(mock_xldriver) -> None:
+    bus = can.Bus(channel=[0, 1], interface="vector", _testing=True)
+    msgs = [
+        can.Message(arbitration_id=0x100, channel=0),
+        can.Message(arbitration_id=0x101, channel=0),
+        can.Message(arbitration_id=0x102, channel=1),
+    ]
+    assert bus.send_batch(msgs) == 3
+
+    xl_can_transmit = can.interfaces.vector.canlib.xldriver.xlCanTransmit
+    assert xl_can_transmit.call_count == 2
+    first_call, second_call = xl_can_transmit.call_args_list
+    assert first_call.args[1] == bus.channel_masks[0]
+    assert first_call.args[2].value == 2
+    assert second_call.args[1] == bus.channel_masks[1]
+    assert second_call.args[2].value == 1
+    can.interfaces.vector.canlib.xldriver.xlCanTransmitEx.assert_not_called()
+
+
 def test_receive_mocked(mock_xldriver) -> None:
     can.interfaces.vector.canlib.xldriver.xlReceive = Mock(side_effect=xlReceive)
     bus = can.Bus(channel=0, interface="vector", _testing=True)